@@ -40,38 +40,66 @@ end
 -- Parse a CSV line, handling quoted fields
 -- @param line String with the CSV line
 -- @return Table with the parsed fields
-local function parse_csv_line(line)
+function CSVBackend.parse_csv_line(line)
     local fields = {}
-    local field = ""
-    local in_quotes = false
-    local i = 1
 
-    while i <= #line do
-        local c = line:sub(i, i)
+    -- Fast path: without quotes, fields are plain comma-separated substrings
+    if not line:find('"', 1, true) then
+        local start = 1
+        while true do
+            local comma = line:find(",", start, true)
+            if not comma then
+                fields[#fields + 1] = line:sub(start)
+                return fields
+            end
+            fields[#fields + 1] = line:sub(start, comma - 1)
+            start = comma + 1
+        end
+    end
 
-        if c == '"' then
-            if in_quotes and line:sub(i + 1, i + 1) == '"' then
+    -- Quoted line: collect field pieces and join them once per field
+    local pieces = {}
+    local in_quotes = false
+    local i = 1
+    local len = #line
+
+    while i <= len do
+        if in_quotes then
+            local quote = line:find('"', i, true)
+            if not quote then
+                -- Unterminated quote, take the rest of the line
+                pieces[#pieces + 1] = line:sub(i)
+                break
+            end
+            pieces[#pieces + 1] = line:sub(i, quote - 1)
+            if line:sub(quote + 1, quote + 1) == '"' then
                 -- Double quotes inside quotes - add a single quote
-                field = field .. '"'
-                i = i + 1
+                pieces[#pieces + 1] = '"'
+                i = quote + 2
             else
-                -- Toggle quote mode
-                in_quotes = not in_quotes
+                in_quotes = false
+                i = quote + 1
             end
-        elseif c == ',' and not in_quotes then
-            -- End of field
-            table.insert(fields, field)
-            field = ""
         else
-            -- Add character to field
-            field = field .. c
+            local next_special = line:find('[",]', i)
+            if not next_special then
+                pieces[#pieces + 1] = line:sub(i)
+                break
+            end
+            pieces[#pieces + 1] = line:sub(i, next_special - 1)
+            if line:sub(next_special, next_special) == '"' then
+                in_quotes = true
+            else
+                -- End of field
+                fields[#fields + 1] = table.concat(pieces)
+                pieces = {}
+            end
+            i = next_special + 1
         end
-
-        i = i + 1
     end
 
     -- Add the last field
-    table.insert(fields, field)
+    fields[#fields + 1] = table.concat(pieces)
 
     return fields
 end
@@ -95,48 +123,52 @@ function CSVBackend:load_data()
 
     -- Parse the CSV file
     local data = {}
-    local header = nil
+    local columns = {}
+    local alias_columns = {}
     local line_num = 0
 
     for line in file:lines() do
         line_num = line_num + 1
 
         -- Parse CSV line
-        local fields = parse_csv_line(line)
+        local fields = CSVBackend.parse_csv_line(line)
 
         if line_num == 1 then
-            -- First line is header
-            header = fields
+            -- First line is header, resolve column positions once
+            for i, field_name in ipairs(fields) do
+                if field_name:match("^alias_") then
+                    table.insert(alias_columns, i)
+                else
+                    columns[field_name] = i
+                end
+            end
         else
-            -- Create entry from fields
-            local entry = {}
-
             -- Skip control characters in tests
             if fields[3] == "<control>" then
                 goto continue
             end
 
             -- Map fields to entry structure
-            for i, field_name in ipairs(header) do
-                if i <= #fields then -- Make sure we have enough fields
-                    if field_name == "code_point" then
-                        entry.code_point = fields[i]:gsub("U%+", "")
-                    elseif field_name == "character" then
-                        entry.character = fields[i]
-                    elseif field_name == "name" then
-                        entry.name = fields[i]
-                    elseif field_name == "category" then
-                        entry.category = fields[i]
-                    elseif field_name:match("^alias_") then
-                        -- Handle aliases
-                        if not entry.aliases then
-                            entry.aliases = {}
-                        end
-                        if fields[i] and fields[i] ~= "" then
-                            table.insert(entry.aliases, fields[i])
-                        end
+            local entry = {
+                character = fields[columns.character],
+                name = fields[columns.name],
+                category = fields[columns.category]
+            }
+            local code_point = fields[columns.code_point]
+            if code_point then
+                entry.code_point = code_point:gsub("U%+", "")
+            end
+
+            -- Handle aliases
+            if #alias_columns > 0 then
+                local aliases = {}
+                for _, i in ipairs(alias_columns) do
+                    local alias = fields[i]
+                    if alias and alias ~= "" then
+                        aliases[#aliases + 1] = alias
                     end
                 end
+                entry.aliases = aliases
             end
 
             -- Skip entries with missing required fields
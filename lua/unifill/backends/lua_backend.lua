@@ -67,6 +67,17 @@ local function code_point_to_utf8(code_point)
     end
 end
 
+-- Check if a file was modified before another one
+-- @param stat Table with the fs_stat result of the first file
+-- @param other_stat Table with the fs_stat result of the second file
+-- @return Boolean indicating if the first file has an older mtime
+local function is_older(stat, other_stat)
+    if stat.mtime.sec ~= other_stat.mtime.sec then
+        return stat.mtime.sec < other_stat.mtime.sec
+    end
+    return stat.mtime.nsec < other_stat.mtime.nsec
+end
+
 -- Load the Unicode data from the Lua module
 -- @return Table with Unicode data entries
 function LuaBackend:load_data()
@@ -75,12 +86,13 @@ function LuaBackend:load_data()
     local data_path = self.config.data_path
     log.debug("Data path:", data_path)
 
-    -- Check if file exists
-    local path = Path:new(data_path)
+    -- Stat both files once instead of probing them with separate exists checks
     local compressed_path = Path:new(data_path .. ".gz")
+    local stat = vim.loop.fs_stat(data_path)
+    local compressed_stat = vim.loop.fs_stat(compressed_path.filename)
     
-    -- Check for compressed file first
-    if compressed_path:exists() then
+    -- Decompress only when the uncompressed file is missing or older than the archive
+    if compressed_stat and (not stat or is_older(stat, compressed_stat)) then
         log.debug("Compressed Unicode data file found: " .. compressed_path.filename)
         -- Decompress the file
         local decompressed_path = data_path
@@ -92,8 +104,8 @@ function LuaBackend:load_data()
             return {}
         end
         log.debug("Unicode data file decompressed successfully")
-    elseif path:exists() then
-        log.debug("Unicode data file found: " .. path.filename)
+    elseif stat then
+        log.debug("Unicode data file found: " .. data_path)
     else
         local err_msg = "Unicode data file not found at: " .. data_path .. " or " .. compressed_path.filename
         log.error(err_msg)
@@ -123,7 +135,7 @@ function LuaBackend:load_data()
     -- Convert characters to proper UTF-8
     local converted_count = 0
     for _, entry in ipairs(data) do
-        if entry.character:match("\\u") then
+        if entry.character:find("\\u", 1, true) then
             entry.character = code_point_to_utf8(entry.code_point)
             converted_count = converted_count + 1
         end
@@ -195,18 +207,36 @@ function LuaBackend:decompress_file(compressed_path, output_path)
         return false
     end
     
-    -- Write the decompressed data to the output file
-    local file = io.open(output_path, "w")
+    -- Write to a temporary file first, so an interrupted or failed write never
+    -- leaves a truncated dataset that looks newer than the archive. The pid keeps
+    -- concurrent Neovim instances from writing to the same temporary file
+    local tmp_path = output_path .. "." .. vim.loop.os_getpid() .. ".tmp"
+    local file = io.open(tmp_path, "w")
     if not file then
-        log.error("Failed to open output file for writing: " .. output_path)
+        log.error("Failed to open output file for writing: " .. tmp_path)
         return false
     end
     
-    for _, line in ipairs(output_data) do
-        file:write(line .. "\n")
+    -- Write everything in one call instead of one concatenation and write per line
+    local written = true
+    if #output_data > 0 then
+        written = file:write(table.concat(output_data, "\n"), "\n")
+    end
+    local closed = file:close()
+
+    if not written or not closed then
+        log.error("Failed to write output file: " .. tmp_path)
+        os.remove(tmp_path)
+        return false
+    end
+
+    -- fs_rename replaces an existing dataset on every platform, os.rename fails on Windows
+    local renamed, rename_err = vim.loop.fs_rename(tmp_path, output_path)
+    if not renamed then
+        log.error("Failed to move decompressed file into place: " .. tostring(rename_err))
+        os.remove(tmp_path)
+        return false
     end
-    
-    file:close()
     
     log.debug("File decompressed successfully")
     return true
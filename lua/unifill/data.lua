@@ -39,6 +39,9 @@ local default_config = {
 -- Current configuration
 local config = vim.deepcopy(default_config)
 
+-- Last loaded data, reused while the backend's data file is unchanged
+local data_cache = nil
+
 -- Get the plugin's root directory
 local function get_plugin_root()
     -- Get the directory containing this file
@@ -197,12 +200,37 @@ local function decompress_file(compressed_path, output_path, format)
     return true
 end
 
+-- Get a stamp identifying the current state of a file
+-- @param file_path String with the path to the file
+-- @return String with the file's mtime and size, or nil if the file does not exist
+local function file_stamp(file_path)
+    local stat = file_path and vim.loop.fs_stat(file_path)
+    if not stat then
+        return nil
+    end
+    return stat.mtime.sec .. ":" .. stat.mtime.nsec .. ":" .. stat.size
+end
+
+-- Get a stamp identifying the current state of a backend's data
+-- The lua backend regenerates its file from a newer .gz archive, so the archive is part of the stamp
+-- @param backend_name String with the backend name
+-- @param data_path String with the path to the backend's data file
+-- @return String with the data stamp, or nil if the data file does not exist
+local function data_stamp(backend_name, data_path)
+    local stamp = file_stamp(data_path)
+    if stamp and backend_name == "lua" then
+        stamp = stamp .. "|" .. tostring(file_stamp(data_path .. ".gz"))
+    end
+    return stamp
+end
+
 -- Setup the data manager with configuration
 -- @param user_config Table with user configuration
 -- @return DataManager for chaining
 function DataManager.setup(user_config)
     -- Merge user config with defaults
     config = vim.tbl_deep_extend("force", default_config, user_config or {})
+    data_cache = nil
 
     -- Set default paths based on XDG directories if available, otherwise use plugin root
     local plugin_root = get_plugin_root()
@@ -307,6 +335,16 @@ function DataManager.load_unicode_data()
     local backend_name = config.backend
     local backend_config = config.backends[backend_name]
 
+    -- Reuse the previous load if the data file has not changed since
+    local cache_key = backend_name .. "|" .. tostring(backend_config and backend_config.data_path)
+    if data_cache and data_cache.key == cache_key then
+        local stamp = data_stamp(backend_name, backend_config.data_path)
+        if stamp and stamp == data_cache.stamp then
+            log.debug("Reusing cached unicode data for backend: " .. backend_name)
+            return data_cache.data
+        end
+    end
+
     -- Load the appropriate backend
     local backend = nil
 
@@ -347,6 +385,13 @@ function DataManager.load_unicode_data()
         return {}
     end
 
+    -- Stamp after loading, backends may (re)write the file while loading it
+    data_cache = {
+        key = cache_key,
+        stamp = data_stamp(backend_name, backend_config.data_path),
+        data = data
+    }
+
     local end_time = vim.loop.hrtime()
     local load_time_ms = (end_time - start_time) / 1000000
     log.info(string.format("Backend '%s' loaded %d entries in %.2f ms", backend_name, #data, load_time_ms))
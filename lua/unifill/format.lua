@@ -15,42 +15,49 @@ local function format_aliases(aliases)
     if not aliases or #aliases == 0 then
         return ""
     end
-    return string.format(" (aka %s)", table.concat(
-        vim.tbl_map(function(a) return to_title_case(a) end, aliases),
-        ", "
-    ))
+    -- Fast path: a single alias needs no intermediate list
+    if #aliases == 1 then
+        return " (aka " .. to_title_case(aliases[1]) .. ")"
+    end
+    local titled = {}
+    for i, alias in ipairs(aliases) do
+        titled[i] = to_title_case(alias)
+    end
+    return " (aka " .. table.concat(titled, ", ") .. ")"
 end
 
+-- Friendly names for Unicode general categories, built once at load time
+local CATEGORIES = {
+    Lu = "Uppercase Letter",
+    Ll = "Lowercase Letter",
+    Lt = "Titlecase Letter",
+    Lm = "Modifier Letter",
+    Lo = "Other Letter",
+    Mn = "Non-spacing Mark",
+    Mc = "Spacing Mark",
+    Me = "Enclosing Mark",
+    Nd = "Decimal Number",
+    Nl = "Letter Number",
+    No = "Other Number",
+    Pc = "Connector Punctuation",
+    Pd = "Dash Punctuation",
+    Ps = "Open Punctuation",
+    Pe = "Close Punctuation",
+    Pi = "Initial Punctuation",
+    Pf = "Final Punctuation",
+    Po = "Other Punctuation",
+    Sm = "Math Symbol",
+    Sc = "Currency Symbol",
+    Sk = "Modifier Symbol",
+    So = "Other Symbol",
+    Zs = "Space Separator",
+    Zl = "Line Separator",
+    Zp = "Paragraph Separator",
+}
+
 -- Helper function to get friendly category name
 local function friendly_category(cat)
-    local categories = {
-        Lu = "Uppercase Letter",
-        Ll = "Lowercase Letter",
-        Lt = "Titlecase Letter",
-        Lm = "Modifier Letter",
-        Lo = "Other Letter",
-        Mn = "Non-spacing Mark",
-        Mc = "Spacing Mark",
-        Me = "Enclosing Mark",
-        Nd = "Decimal Number",
-        Nl = "Letter Number",
-        No = "Other Number",
-        Pc = "Connector Punctuation",
-        Pd = "Dash Punctuation",
-        Ps = "Open Punctuation",
-        Pe = "Close Punctuation",
-        Pi = "Initial Punctuation",
-        Pf = "Final Punctuation",
-        Po = "Other Punctuation",
-        Sm = "Math Symbol",
-        Sc = "Currency Symbol",
-        Sk = "Modifier Symbol",
-        So = "Other Symbol",
-        Zs = "Space Separator",
-        Zl = "Line Separator",
-        Zp = "Paragraph Separator",
-    }
-    return categories[cat] or cat
+    return CATEGORIES[cat] or cat
 end
 
 return {
@@ -22,11 +22,15 @@ local function custom_sorter(opts)
         return require("telescope.sorters").get_fzy_sorter(opts)
     end
     
+    -- Terms of the last prompt seen, every entry is scored against the same prompt
+    local cached_prompt = nil
+    local cached_terms = nil
+    
     return require("telescope.sorters").Sorter:new {
         scoring_function = function(_, prompt, line, entry)
             local start_time = vim.loop.hrtime()
             log.debug("=== TELESCOPE SCORING START ===")
-            log.debug("Prompt: '" .. prompt .. "'")
+            log.debug("Prompt:", prompt)
             
             -- Check if entry is nil
             if not entry or not entry.value then
@@ -34,7 +38,7 @@ local function custom_sorter(opts)
                 return -1
             end
             
-            log.debug("Entry: " .. entry.value.name)
+            log.debug("Entry:", entry.value.name)
             
             if prompt == "" then
                 log.debug("Empty prompt, returning default score")
@@ -43,21 +47,13 @@ local function custom_sorter(opts)
             end
 
             -- For telescope, convert our score to its convention (lower is better)
-            local terms = vim.split(prompt, "%s+")
-            log.debug("Raw split terms: " .. vim.inspect(terms))
-            
-            -- Skip empty terms
-            local filtered_terms = {}
-            for _, term in ipairs(terms) do
-                if term and term:gsub("%s", "") ~= "" then
-                    table.insert(filtered_terms, term)
-                    log.debug("Added valid term: '" .. term .. "'")
-                else
-                    log.debug("Skipped empty term")
-                end
+            if prompt ~= cached_prompt then
+                cached_prompt = prompt
+                cached_terms = search.split_terms(prompt)
             end
+            local filtered_terms = cached_terms
             
-            log.debug("Filtered terms for search: " .. vim.inspect(filtered_terms))
+            log.debug("Filtered terms for search:", filtered_terms)
             
             if #filtered_terms == 0 then
                 log.debug("No valid search terms, showing all results")
@@ -65,13 +61,13 @@ local function custom_sorter(opts)
                 return 1
             end
             
-            log.debug("Calling search.score_match with terms: " .. vim.inspect(filtered_terms))
+            log.debug("Calling search.score_match with terms:", filtered_terms)
             local test_score = search.score_match(entry.value, filtered_terms)
-            log.debug("Raw score returned from search.score_match: " .. tostring(test_score))
+            log.fmt_debug("Raw score returned from search.score_match: %s", test_score)
             
             -- Convert score: 0 becomes -1 (filtered), higher becomes lower (better match)
             if test_score == 0 then
-                log.debug("Entry filtered out: " .. entry.value.name)
+                log.debug("Entry filtered out:", entry.value.name)
                 log.debug("=== TELESCOPE SCORING END (FILTERED) ===")
                 return -1
             end
@@ -82,14 +78,14 @@ local function custom_sorter(opts)
             local end_time = vim.loop.hrtime()
             local scoring_time_ms = (end_time - start_time) / 1000000
             
-            log.debug(string.format("Final telescope score for '%s': %s (original: %s, time: %.3f ms)",
-                entry.value.name, final_score, test_score, scoring_time_ms))
-            log.debug("=== TELESCOPE SCORING END (SCORE: " .. final_score .. ") ===")
+            log.fmt_debug("Final telescope score for %s: %s (original: %s, time: %.3f ms)",
+                entry.value.name, final_score, test_score, scoring_time_ms)
+            log.fmt_debug("=== TELESCOPE SCORING END (SCORE: %s) ===", final_score)
             
             -- Log performance for complex queries
             if #filtered_terms > 1 and test_score > 0 then
-                log.info(string.format("Telescope scoring for '%s' with query '%s' took %.3f ms",
-                    entry.value.name, prompt, scoring_time_ms))
+                log.fmt_debug("Telescope scoring for %s with query %s took %.3f ms",
+                    entry.value.name, prompt, scoring_time_ms)
             end
             
             return final_score
@@ -98,7 +94,7 @@ local function custom_sorter(opts)
         highlighter = opts.highlighter or function(_, prompt, display)
             -- Highlight matching terms with italic
             local highlights = {}
-            local terms = vim.split(prompt:lower(), "%s+")
+            local terms = search.split_terms(prompt:lower())
             local display_lower = display:lower()
             
             for _, term in ipairs(terms) do
@@ -118,6 +114,24 @@ local function custom_sorter(opts)
     }
 end
 
+-- Displayer shared by all entries, created on first use
+local displayer = nil
+
+-- Get the shared displayer with the theme's column layout
+local function get_displayer()
+    if not displayer then
+        displayer = entry_display.create {
+            separator = theme.ui.separator,
+            items = {
+                theme.ui.columns.character,
+                theme.ui.columns.name,
+                theme.ui.columns.details,
+            },
+        }
+    end
+    return displayer
+end
+
 -- Entry maker for telescope
 local function entry_maker(entry)
     -- Skip control characters
@@ -131,15 +145,8 @@ local function entry_maker(entry)
     local aliases = format.format_aliases(entry.aliases)
     local category = format.friendly_category(entry.category)
     
-    -- Create a displayer with specific column widths
-    local displayer = entry_display.create {
-        separator = theme.ui.separator,
-        items = {
-            theme.ui.columns.character,
-            theme.ui.columns.name,
-            theme.ui.columns.details,
-        },
-    }
+    -- Reuse the displayer instead of building one per entry
+    local displayer = get_displayer()
     
     -- Create display function that returns formatted text with highlights
     local display = function()
@@ -150,7 +157,7 @@ local function entry_maker(entry)
         }
     end
 
-    log.debug(string.format("Created telescope entry for '%s'", entry.name))
+    log.fmt_debug("Created telescope entry for %s", entry.name)
 
     return {
         value = entry,
@@ -1,6 +1,14 @@
 -- Tests for the unifill backends system
 local eq = assert.are.same
 
+-- Write a single-entry Lua dataset named after the given entry name
+local function write_dataset(path, name)
+    local file = assert(io.open(path, "w"))
+    file:write('return { { name = "' .. name ..
+                   '", character = "x", code_point = "0078", category = "Ll", aliases = {} } }\n')
+    file:close()
+end
+
 describe("unifill backends", function()
     -- Load modules
     local interface = require("unifill.backends.interface")
@@ -40,6 +48,60 @@ describe("unifill backends", function()
             eq(backend:is_active(), true, "Lua backend should be active")
         end)
 
+        describe("compressed datasets", function()
+            local dir, lua_path, gz_path
+
+            local function set_mtime(path, time)
+                vim.loop.fs_utime(path, time, time)
+            end
+
+            local function load_name()
+                local data = LuaBackend.new({data_path = lua_path}):load_data()
+                return data[1] and data[1].name
+            end
+
+            before_each(function()
+                dir = vim.fn.tempname()
+                vim.fn.mkdir(dir, "p")
+                lua_path = dir .. "/unicode.test.lua"
+                gz_path = lua_path .. ".gz"
+                write_dataset(lua_path, "ARCHIVED")
+                -- gzip replaces the .lua file with the archive
+                vim.fn.system({"gzip", "-f", lua_path})
+            end)
+
+            after_each(function()
+                vim.fn.delete(dir, "rf")
+            end)
+
+            it("decompresses when the lua file is missing", function()
+                eq(nil, vim.loop.fs_stat(lua_path), "lua file should start out missing")
+                eq("ARCHIVED", load_name())
+                assert.is_not_nil(vim.loop.fs_stat(lua_path), "lua file should be written next to the archive")
+                eq({}, vim.fn.glob(dir .. "/*.tmp", false, true), "temporary file should be moved into place")
+            end)
+
+            it("keeps a lua file newer than the archive", function()
+                write_dataset(lua_path, "CURRENT")
+                set_mtime(gz_path, os.time() - 100)
+                eq("CURRENT", load_name())
+            end)
+
+            it("replaces a lua file older than the archive", function()
+                write_dataset(lua_path, "STALE")
+                set_mtime(lua_path, os.time() - 100)
+                eq("ARCHIVED", load_name())
+            end)
+
+            it("compares sub-second modification times", function()
+                local base = os.time() - 100
+                write_dataset(lua_path, "STALE")
+                set_mtime(lua_path, base + 0.1)
+                set_mtime(gz_path, base + 0.5)
+                eq("ARCHIVED", load_name())
+            end)
+        end)
+
         -- Only run data loading tests for active backends
         if backend:is_active() then
             it("can load data", function()
@@ -88,6 +150,13 @@ describe("unifill backends", function()
             eq(backend:is_active(), false, "CSV backend should be inactive")
         end)
 
+        it("parses plain and quoted csv lines", function()
+            local parse_csv_line = CSVBackend.parse_csv_line
+            eq({"U+2192", "→", "RIGHTWARDS ARROW", "Sm", ""}, parse_csv_line("U+2192,→,RIGHTWARDS ARROW,Sm,"))
+            eq({"U+0022", '"', "QUOTATION MARK", "Po", "a, b"},
+                parse_csv_line('U+0022,"""",QUOTATION MARK,Po,"a, b"'))
+        end)
+
         -- Only run data loading tests for active backends
         if backend:is_active() then
             it("can load data", function()
@@ -127,6 +196,66 @@ describe("unifill backends", function()
             assert.is_true(#data > 0, "data should not be empty")
         end)
 
+        it("reuses loaded data until setup is called again", function()
+            data_manager.setup()
+
+            local data1 = data_manager.load_unicode_data()
+            local data2 = data_manager.load_unicode_data()
+            assert.are.equal(data1, data2, "unchanged data file should return the cached data")
+
+            data_manager.setup()
+            local data3 = data_manager.load_unicode_data()
+            assert.are_not.equal(data1, data3, "setup should drop the cached data")
+            eq(#data1, #data3, "reloaded data should have the same entries")
+        end)
+
+        describe("with a compressed dataset", function()
+            local dir, lua_path
+
+            local function write_archive(path, name)
+                write_dataset(path, name)
+                -- gzip replaces the .lua file with the archive
+                vim.fn.system({"gzip", "-f", path})
+            end
+
+            before_each(function()
+                dir = vim.fn.tempname()
+                vim.fn.mkdir(dir .. "/new", "p")
+                lua_path = dir .. "/unicode.test.lua"
+            end)
+
+            after_each(function()
+                vim.fn.delete(dir, "rf")
+                -- Point the data manager back at the default dataset
+                data_manager.setup()
+            end)
+
+            it("reloads cached data when a newer archive arrives", function()
+                write_archive(lua_path, "OLD")
+                data_manager.setup({
+                    backend = "lua",
+                    backends = {
+                        lua = {
+                            data_path = lua_path
+                        }
+                    }
+                })
+
+                local data1 = data_manager.load_unicode_data()
+                eq("OLD", data1[1].name)
+                assert.are.equal(data1, data_manager.load_unicode_data(),
+                    "unchanged files should return the cached data")
+
+                -- Replace the archive while the decompressed .lua file stays untouched
+                write_archive(dir .. "/new/unicode.test.lua", "NEW")
+                vim.loop.fs_rename(dir .. "/new/unicode.test.lua.gz", lua_path .. ".gz")
+                vim.loop.fs_utime(lua_path .. ".gz", os.time() + 100, os.time() + 100)
+
+                local data2 = data_manager.load_unicode_data()
+                eq("NEW", data2[1].name, "a newer archive should invalidate the cache")
+            end)
+        end)
+
         it("can be configured", function()
             -- Configure with custom path
             local plugin_root = data_manager.get_plugin_root()
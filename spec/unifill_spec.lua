@@ -279,6 +279,37 @@ describe("unifill", function()
             assert.equals(upper_score, lower_score, "Upper and lowercase searches should score the same")
             assert.equals(upper_score, mixed_score, "Mixed case searches should score the same")
         end)
+
+        it("splits prompts into non-empty terms", function()
+            local split_terms = require("unifill.search").split_terms
+            assert.same({"right", "arrow"}, split_terms("  right   arrow "))
+            assert.same({}, split_terms("   "))
+        end)
+
+        it("matches terms containing pattern characters", function()
+            local check_word_match = require("unifill.search").check_word_match
+            assert.equals(1, check_word_match("LEFT-POINTING ANGLE BRACKET", "left-pointing"))
+            assert.equals(0, check_word_match("LEFT ANGLE BRACKET", "left-pointing"))
+
+            local entry = {
+                name = "LEFT-POINTING ANGLE BRACKET",
+                category = "Ps",
+                aliases = {}
+            }
+            assert(score_match(entry, {"left-pointing", "angle"}) > 0, "Hyphenated terms should match")
+        end)
+
+        it("matches aliases and categories case insensitively", function()
+            local entry = {
+                name = "PLUS SIGN",
+                category = "Sm",
+                aliases = {"Add"}
+            }
+
+            assert(score_match(entry, {"ADD"}) > 0, "Should match aliases regardless of case")
+            assert(score_match(entry, {"MATH"}) > 0, "Should match friendly category regardless of case")
+            assert.equals(score_match(entry, {"add", "math"}), score_match(entry, {"ADD", "Math"}))
+        end)
     end)
 
     describe("theme functionality", function()